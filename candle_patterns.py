@@ -0,0 +1,139 @@
+import numpy as np
+
+# ===============================
+# 🕯️ CANDLESTICK PATTERNS
+# ===============================
+# ชุดแพทเทิร์นแท่งเทียน: ชื่อ -> (ข้อความ, ฝั่ง, คะแนน)
+CANDLE_PATTERNS = {
+    "bullish_engulfing": ("🟢 Bullish Engulfing", "buy", 2),
+    "bearish_engulfing": ("🔴 Bearish Engulfing", "sell", 2),
+    "hammer": ("🔨 Hammer", "buy", 2),
+    "shooting_star": ("🌠 Shooting Star", "sell", 2),
+    "morning_star": ("🌅 Morning Star", "buy", 3),
+    "evening_star": ("🌆 Evening Star", "sell", 3),
+    "doji": ("⭐ Doji (Indecision)", None, 0),
+    "inside_bar": ("📦 Inside Bar", None, 0),
+}
+
+# จำนวนแท่งก่อนหน้าที่ใช้ดูแนวโน้มของ Hammer / Shooting Star
+TREND_WINDOW = 10
+
+# ขนาด array ชั่วคราวต่อช่วงที่สแกน (byte): ให้อยู่ใน cache และต่ำกว่า
+# mmap threshold ของ malloc (128 KiB) ไม่งั้นทุก array ชั่วคราวจะ mmap/page fault ใหม่
+BLOCK_BYTES = 120 * 1024
+
+def _as_float(a):
+    # ใช้ dtype เดิมถ้าเป็นทศนิยมอยู่แล้ว (float32 เร็วกว่าเกือบเท่าตัวบนข้อมูลใหญ่)
+    a = np.asarray(a)
+    return a if a.dtype.kind == 'f' else a.astype(np.float64)
+
+def _all(out, *masks):
+    # AND ทุก mask ลงใน out โดยไม่สร้าง array ผลลัพธ์ใหม่
+    np.logical_and(masks[0], masks[1], out=out)
+    for mask in masks[2:]:
+        out &= mask
+    return out
+
+def _scan_block(o, h, lo, c, patterns, trend_window):
+    # ตรวจแพทเทิร์นของช่วงแท่งหนึ่ง เขียนผลลง patterns (mask ขนาดเท่ากับ c)
+    n = len(c)
+    body = np.abs(c - o)
+    rng = h - lo
+    bull = c > o
+    bear = c < o
+
+    # rng == 0 ให้ 0 < 0 เป็น False อยู่แล้ว จึงไม่ต้องเช็ค rng > 0 แยก
+    doji = np.less(body, rng * 0.1, out=patterns["doji"])
+
+    # Hammer / Shooting Star: ตัดแท่งแบน (O=H=L=C) และ doji ออก, ไส้ยาวอย่างน้อย 60% ของแท่ง
+    # และต้องเกิดหลังแนวโน้ม: ราคาปิดต่ำ/สูงกว่าค่าเฉลี่ย N แท่งก่อนหน้า
+    if n > trend_window:
+        cur = slice(trend_window, None)
+        window = c[:-trend_window].copy()
+        for k in range(1, trend_window):
+            window += c[k:n - trend_window + k]
+        scaled = c[cur] * trend_window
+        body_c = body[cur]
+        solid = ~doji[cur] & (body_c > 0)
+        # ไส้ต้องยาวทั้ง >= 2 เท่าของตัวแท่ง และ >= 60% ของช่วงแท่ง
+        shadow_min = body_c * 2
+        np.maximum(shadow_min, rng[cur] * 0.6, out=shadow_min)
+        upper = np.maximum(o[cur], c[cur])
+        np.subtract(h[cur], upper, out=upper)
+        lower = np.minimum(o[cur], c[cur])
+        np.subtract(lower, lo[cur], out=lower)
+        _all(patterns["hammer"][cur], scaled < window, solid,
+             lower >= shadow_min, upper <= body_c)
+        _all(patterns["shooting_star"][cur], scaled > window, solid,
+             upper >= shadow_min, lower <= body_c)
+
+    if n < 2:
+        return
+
+    # แพทเทิร์น 2 แท่ง: [1:] คือแท่งปัจจุบัน, [:-1] คือแท่งก่อนหน้า
+    # Engulfing: ทิศแท่งก่อน + เงื่อนไขเปิด/ปิดครอบ บังคับทิศแท่งปัจจุบันอยู่แล้ว
+    # (เช่น o <= c_prev < o_prev <= c จึงได้ c > o)
+    _all(patterns["bullish_engulfing"][1:], bear[:-1], o[1:] <= c[:-1], c[1:] >= o[:-1])
+    _all(patterns["bearish_engulfing"][1:], bull[:-1], o[1:] >= c[:-1], c[1:] <= o[:-1])
+    _all(patterns["inside_bar"][1:], h[1:] < h[:-1], lo[1:] > lo[:-1])
+
+    if n < 3:
+        return
+
+    # Star: แท่งแรกตัวยาว, แท่งกลางตัวเล็ก, แท่งสุดท้ายปิดเกินครึ่งตัวแท่งแรก
+    base = np.logical_and(body[:-2] > rng[:-2] * 0.5, body[1:-1] < body[:-2] * 0.3)
+    mid2x = o[:-2] + c[:-2]
+    close2x = c[2:] * 2
+    _all(patterns["morning_star"][2:], base, bear[:-2], bull[2:], close2x > mid2x)
+    _all(patterns["evening_star"][2:], base, bull[:-2], bear[2:], close2x < mid2x)
+
+def scan_patterns(open_, high, low, close, trend_window=TREND_WINDOW):
+    """ตรวจแพทเทิร์นแท่งเทียนทุกแท่งในครั้งเดียว คืนค่า {ชื่อ: boolean mask}
+
+    รับ array 1 มิติ (แท่ง) หรือ 2 มิติ (แท่ง x สัญลักษณ์) ก็ได้
+    แพทเทิร์นหลายแท่งเทียบกับแท่งก่อนหน้าด้วย slice ที่เลื่อนกัน (a[1:] กับ a[:-1])
+    ข้อมูลใหญ่จะถูกแบ่งทีละช่วงแท่ง (พร้อมแท่งย้อนหลัง) ให้ array ชั่วคราวพอดี cache
+    """
+    if trend_window < 1:
+        raise ValueError(f"trend_window ต้องมีค่าอย่างน้อย 1 (ได้ {trend_window})")
+    o, h, lo, c = (_as_float(a) for a in (open_, high, low, close))
+    n = len(c)
+    patterns = {name: np.zeros(c.shape, dtype=bool) for name in CANDLE_PATTERNS}
+    lookback = max(trend_window, 2)
+    row_bytes = c[0].nbytes if n else 1
+    step = max(BLOCK_BYTES // row_bytes - lookback, 16)
+
+    # แต่ละช่วงเขียนลง view ของผลลัพธ์ได้ตรง ๆ: _scan_block เขียนเฉพาะแท่งที่มีข้อมูลย้อนหลังครบ
+    # แท่งย้อนหลังที่ซ้อนกับช่วงก่อนจึงได้ค่าเดิม หรือไม่ถูกแตะเลย
+    for start in range(0, n, step):
+        first = max(start - lookback, 0)
+        end = min(start + step, n)
+        block = {name: mask[first:end] for name, mask in patterns.items()}
+        _scan_block(o[first:end], h[first:end], lo[first:end], c[first:end], block, trend_window)
+    return patterns
+
+def pattern_scores(patterns):
+    """คะแนน buy/sell ของแพทเทิร์นทุกแท่ง ใช้ได้ทั้งสัญญาณล่าสุดและ backtest
+
+    แต่ละฝั่งนับเฉพาะแพทเทิร์นที่แรงที่สุดของแท่งนั้น (สูงสุด 3 คะแนน)
+    เพื่อไม่ให้แพทเทิร์นซ้อนกันหลายตัวดันสัญญาณไปถึง STRONG เอง
+    """
+    shape = next(iter(patterns.values())).shape
+    buy = np.zeros(shape, dtype=np.int8)
+    sell = np.zeros(shape, dtype=np.int8)
+    for name, mask in patterns.items():
+        _, side, weight = CANDLE_PATTERNS[name]
+        if side == "buy":
+            np.maximum(buy, weight, out=buy, where=mask)
+        elif side == "sell":
+            np.maximum(sell, weight, out=sell, where=mask)
+    return buy, sell
+
+def detect_patterns(df):
+    """แพทเทิร์นของแท่งล่าสุด คืนค่า (รายชื่อแพทเทิร์น, คะแนน buy, คะแนน sell)"""
+    if df.empty:
+        return [], 0, 0
+    patterns = scan_patterns(df['Open'], df['High'], df['Low'], df['Close'])
+    buy, sell = pattern_scores({name: mask[-1:] for name, mask in patterns.items()})
+    labels = [CANDLE_PATTERNS[name][0] for name, mask in patterns.items() if mask[-1]]
+    return labels, int(buy[0]), int(sell[0])
@@ -12,6 +12,8 @@ import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from io import BytesIO
 
+from candle_patterns import detect_patterns
+
 # ===============================
 # 🔧 CONFIG
 # ===============================
@@ -44,23 +46,6 @@ def find_support_resistance(df, window=20):
     resistance = df['High'].tail(window).max()
     return support, resistance
 
-def detect_patterns(df):
-    patterns = []
-    if len(df) < 2:
-        return patterns
-    latest, prev = df.iloc[-1], df.iloc[-2]
-    # Engulfing
-    if latest['Close'] > latest['Open'] and prev['Close'] < prev['Open'] and latest['Open'] <= prev['Close'] and latest['Close'] >= prev['Open']:
-        patterns.append("🟢 Bullish Engulfing")
-    elif latest['Close'] < latest['Open'] and prev['Close'] > prev['Open'] and latest['Open'] >= prev['Close'] and latest['Close'] <= prev['Open']:
-        patterns.append("🔴 Bearish Engulfing")
-    # Doji
-    body = abs(latest['Close'] - latest['Open'])
-    rng = latest['High'] - latest['Low']
-    if rng > 0 and body < rng * 0.1:
-        patterns.append("⭐ Doji (Indecision)")
-    return patterns
-
 # ===============================
 # ⚙️ ANALYSIS
 # ===============================
@@ -170,6 +155,13 @@ def analyze_trading_signal(df):
             sell += 1
             signals.append(f"⬇️ Strong Momentum: {price_change:.2f}%")
 
+    # 7. Candlestick Patterns (นับเฉพาะแพทเทิร์นที่แรงที่สุด สูงสุด 3 คะแนน)
+    found, pattern_buy, pattern_sell = detect_patterns(df)
+    buy += pattern_buy
+    sell += pattern_sell
+    if found:
+        signals.append("🕯️ " + ", ".join(found))
+
     # สรุปสัญญาณ
     if buy > sell and buy >= 5:
         signal_type = "STRONG BUY" if buy >= 10 else "BUY"
@@ -237,7 +229,7 @@ async def analyze_forex(symbol: str):
             f"{'='*35}\n\n"
             f"🔍 SIGNALS:\n"
         )
-        for i, sig in enumerate(signals[:6], 1):
+        for i, sig in enumerate(signals[:7], 1):
             msg += f"{i}. {sig}\n"
 
         msg += f"\n💬 คำแนะนำ:\n{advice}\n"
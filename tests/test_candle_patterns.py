@@ -0,0 +1,152 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from candle_patterns import (
+    CANDLE_PATTERNS, TREND_WINDOW, detect_patterns, pattern_scores, scan_patterns,
+)
+
+
+def _ohlc(bars):
+    o, h, lo, c = (np.array(col, dtype=float) for col in zip(*bars))
+    return o, h, lo, c
+
+
+def _flagged(patterns, i=-1):
+    return {name for name, mask in patterns.items() if mask[i]}
+
+
+def _trend(direction, n=TREND_WINDOW):
+    # แท่งตัวเต็มที่ไต่ขึ้น/ลงทีละ 1 ไม่มีไส้ ให้ค่าเฉลี่ยก่อนหน้าอยู่เหนือ/ใต้ราคาชัดเจน
+    bars = []
+    for i in range(n):
+        start = 100 + direction * i
+        end = start + direction
+        bars.append((start, max(start, end), min(start, end), end))
+    return bars
+
+
+def _random_ohlc(shape, seed, dtype=np.float64):
+    # random walk ที่ได้ OHLC ถูกต้อง (High >= Open/Close >= Low)
+    rng = np.random.default_rng(seed)
+    c = 100 + np.cumsum(rng.standard_normal(shape), axis=0)
+    o = c + rng.standard_normal(shape) * 0.5
+    h = np.maximum(o, c) + rng.random(shape)
+    lo = np.minimum(o, c) - rng.random(shape)
+    return tuple(a.astype(dtype, copy=False) for a in (o, h, lo, c))
+
+
+def test_bullish_engulfing():
+    p = scan_patterns(*_ohlc([(10, 10.2, 8.8, 9), (8.8, 10.6, 8.7, 10.5)]))
+    assert _flagged(p, 1) == {"bullish_engulfing"}
+    assert not p["bullish_engulfing"][0]
+
+
+def test_bearish_engulfing():
+    p = scan_patterns(*_ohlc([(9, 10.2, 8.8, 10), (10.2, 10.3, 8.5, 8.7)]))
+    assert _flagged(p, 1) == {"bearish_engulfing"}
+
+
+def test_doji():
+    p = scan_patterns(*_ohlc([(10, 11, 9, 10.05)]))
+    assert _flagged(p, 0) == {"doji"}
+
+
+def test_inside_bar():
+    p = scan_patterns(*_ohlc([(10, 12, 8, 11), (10.5, 11, 9, 10)]))
+    assert _flagged(p, 1) == {"inside_bar"}
+
+
+def test_hammer_after_downtrend():
+    bars = _trend(-1) + [(88.5, 89, 85, 89)]
+    p = scan_patterns(*_ohlc(bars))
+    assert "hammer" in _flagged(p)
+    assert "shooting_star" not in _flagged(p)
+
+
+def test_hammer_needs_downtrend():
+    bars = _trend(1) + [(111.5, 112, 108.5, 112)]
+    assert "hammer" not in _flagged(scan_patterns(*_ohlc(bars)))
+
+
+def test_shooting_star_after_uptrend():
+    bars = _trend(1) + [(111, 115, 110.5, 110.5)]
+    p = scan_patterns(*_ohlc(bars))
+    assert "shooting_star" in _flagged(p)
+    assert "hammer" not in _flagged(p)
+
+
+def test_morning_star_offsets():
+    bars = [(12, 12.1, 9.9, 10), (9.8, 10, 9.5, 9.9), (10, 11.6, 9.9, 11.5)]
+    p = scan_patterns(*_ohlc(bars))
+    assert p["morning_star"].tolist() == [False, False, True]
+
+
+def test_evening_star_offsets():
+    bars = [(10, 12.1, 9.9, 12), (12.1, 12.5, 12, 12.2), (12, 12.1, 10.4, 10.5)]
+    p = scan_patterns(*_ohlc(bars))
+    assert p["evening_star"].tolist() == [False, False, True]
+
+
+def test_flat_bars_flag_nothing():
+    p = scan_patterns(*_ohlc([(1, 1, 1, 1)] * (TREND_WINDOW + 3)))
+    assert not any(mask.any() for mask in p.values())
+
+
+@pytest.mark.parametrize("n", [0, 1, 2])
+def test_short_input(n):
+    bars = [(10, 11, 9, 10.05), (10.5, 10.8, 9.5, 10)][:n]
+    p = scan_patterns(*(_ohlc(bars) if bars else [np.array([])] * 4))
+    assert set(p) == set(CANDLE_PATTERNS)
+    assert all(mask.shape == (n,) for mask in p.values())
+
+
+def test_trend_window_must_be_positive():
+    with pytest.raises(ValueError, match="trend_window"):
+        scan_patterns(*_random_ohlc((50,), seed=0), trend_window=0)
+
+
+def test_2d_matches_1d():
+    o, h, lo, c = _random_ohlc((300, 5), seed=1)
+    wide = scan_patterns(o, h, lo, c)
+    for j in range(c.shape[1]):
+        single = scan_patterns(o[:, j], h[:, j], lo[:, j], c[:, j])
+        for name in CANDLE_PATTERNS:
+            np.testing.assert_array_equal(wide[name][:, j], single[name])
+
+
+def test_blocks_match_single_pass(monkeypatch):
+    o, h, lo, c = _random_ohlc((1000, 3), seed=2)
+    whole = scan_patterns(o, h, lo, c)
+    monkeypatch.setattr("candle_patterns.BLOCK_BYTES", 1)
+    blocked = scan_patterns(o, h, lo, c)
+    for name in CANDLE_PATTERNS:
+        np.testing.assert_array_equal(blocked[name], whole[name])
+
+
+def test_scores_capped_at_strongest_pattern():
+    patterns = {name: np.zeros(2, dtype=bool) for name in CANDLE_PATTERNS}
+    for name in ("hammer", "bullish_engulfing", "morning_star"):
+        patterns[name][1] = True
+    buy, sell = pattern_scores(patterns)
+    assert buy.tolist() == [0, 3]
+    assert sell.tolist() == [0, 0]
+
+
+def test_detect_patterns_latest_bar():
+    df = pd.DataFrame([(10, 10.2, 8.8, 9), (8.8, 10.6, 8.7, 10.5)],
+                      columns=["Open", "High", "Low", "Close"])
+    assert detect_patterns(df) == (["🟢 Bullish Engulfing"], 2, 0)
+    assert detect_patterns(df.iloc[:0]) == ([], 0, 0)
+
+
+@pytest.mark.slow
+def test_scan_speed():
+    # benchmark (รันเองด้วย pytest -m slow): 50,000 แท่ง x 300 สัญลักษณ์ แบบ float64
+    # ตามข้อมูลจริงจาก yfinance ต้องเสร็จภายใน 1 วินาที (~0.5 วินาทีบน 1 core)
+    o, h, lo, c = _random_ohlc((50_000, 300), seed=0)
+    start = time.perf_counter()
+    pattern_scores(scan_patterns(o, h, lo, c))
+    assert time.perf_counter() - start < 1.0